@@ -7,7 +7,7 @@ Demonstrates using StreamGuard native Python bindings for server-side guardrails
 import sys
 sys.path.insert(0, './pkg-python')
 
-from streamguard import GuardEngine, ForbiddenSequenceRule, PatternRule
+from streamguard import Decision, GuardEngine, ForbiddenSequenceRule, PatternRule
 
 
 def example1_basic_blocking():
@@ -34,7 +34,7 @@ def example1_basic_blocking():
     chunks = ['How ', 'to ', 'build ', 'a ', 'bomb']
     for chunk in chunks:
         decision = engine.feed(chunk)
-        if decision.is_block():
+        if decision.kind == Decision.BLOCK:
             print(f'🚫 Blocked: {decision.reason()}')
             break
 
@@ -52,7 +52,7 @@ def example2_email_redaction():
     text = 'Contact me at john@example.com for details'
     decision = engine.feed(text)
     
-    if decision.is_rewrite():
+    if decision.kind == Decision.REWRITE:
         print(f'Original: {text}')
         print(f'Redacted: {decision.rewritten_text()}')
 
@@ -90,7 +90,7 @@ def example3_scoring_system():
         decision = engine.feed(chunk)
         print(f'Score: {engine.current_score()}', decision)
         
-        if decision.is_block():
+        if decision.kind == Decision.BLOCK:
             print('🚫 Blocked due to score threshold!')
             break
 
@@ -118,22 +118,22 @@ def example4_streaming_llm():
     print(f'Original response: {llm_response}')
     print('Streaming with guardrails:')
     
-    output = ''
-    for i in range(0, len(llm_response), chunk_size):
-        chunk = llm_response[i:i + chunk_size]
-        decision = engine.feed(chunk)
-        
-        if decision.is_allow():
-            output += chunk
-            print(chunk, end='', flush=True)
-        elif decision.is_rewrite():
-            output = decision.rewritten_text()
-            print('\n[Content rewritten]')
-            print(output)
-            break
-        elif decision.is_block():
-            print(f'\n🚫 Stream blocked: {decision.reason()}')
-            break
+    chunks = [llm_response[i:i + chunk_size]
+              for i in range(0, len(llm_response), chunk_size)]
+
+    # One native call scans the stream and appends the safe chunks to `out`;
+    # it stops at the first block/rewrite
+    out = bytearray()
+    decision, _ = engine.stream_into(chunks, out)
+    print(out.decode('utf-8'), end='')
+
+    kind = decision.kind
+    if kind == Decision.REWRITE:
+        output = decision.rewritten_text()
+        print('\n[Content rewritten]')
+        print(output)
+    elif kind == Decision.BLOCK:
+        print(f'\n🚫 Stream blocked: {decision.reason()}')
     print()
 
 
@@ -152,15 +152,16 @@ def example5_flask_middleware():
                     self.engine.add_pattern_rule(rule)
         
         def check_content(self, content):
-            self.engine.reset()
-            decision = self.engine.feed(content)
+            # Each request is its own stream: reset and scan in one call
+            decision = self.engine.scan_independent(content)
             
-            if decision.is_block():
+            kind = decision.kind
+            if kind == Decision.BLOCK:
                 return {
                     'allowed': False,
                     'reason': decision.reason()
                 }
-            elif decision.is_rewrite():
+            elif kind == Decision.REWRITE:
                 return {
                     'allowed': True,
                     'modified': True,
@@ -209,28 +210,26 @@ def example6_batch_processing():
     
     print(f'Processing {len(documents)} documents...\n')
     
-    results = []
-    for index, doc in enumerate(documents):
-        engine.reset()
-        decision = engine.feed(doc)
-        
-        decision_type = 'allowed' if decision.is_allow() else \
-                       'blocked' if decision.is_block() else \
-                       'rewritten'
-        
-        output = decision.rewritten_text() if decision.is_rewrite() else \
-                f'[BLOCKED: {decision.reason()}]' if decision.is_block() else \
-                doc
-        
-        results.append({
-            'index': index,
-            'original': doc,
-            'decision': decision_type,
-            'output': output
-        })
-    
-    for r in results:
-        print(f"Doc {r['index'] + 1} [{r['decision']}]: {r['output']}")
+    # One native call scans every document as an independent stream
+    decisions = engine.scan_batch(documents)
+
+    # Format each row once and write the report with a single print
+    lines = []
+    for index, (doc, decision) in enumerate(zip(documents, decisions), start=1):
+        kind = decision.kind
+        if kind == Decision.REWRITE:
+            decision_type = 'rewritten'
+            output = decision.rewritten_text()
+        elif kind == Decision.BLOCK:
+            decision_type = 'blocked'
+            output = f'[BLOCKED: {decision.reason()}]'
+        else:
+            decision_type = 'allowed'
+            output = doc
+
+        lines.append(f'Doc {index} [{decision_type}]: {output}')
+
+    print('\n'.join(lines))
 
 
 def example7_async_generator():
@@ -242,10 +241,11 @@ def example7_async_generator():
         for chunk in chunks:
             decision = engine.feed(chunk)
             
-            if decision.is_block():
+            kind = decision.kind
+            if kind == Decision.BLOCK:
                 yield {'type': 'block', 'reason': decision.reason()}
                 break
-            elif decision.is_rewrite():
+            elif kind == Decision.REWRITE:
                 yield {'type': 'rewrite', 'text': decision.rewritten_text()}
                 break
             else:
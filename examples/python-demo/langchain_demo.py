@@ -12,11 +12,17 @@ Environment Variables:
     OPENAI_API_KEY: Your OpenAI API key (for real LLM examples)
 """
 
+import asyncio
+import io
+import operator
 import os
+import queue
 import sys
+import threading
+from functools import lru_cache
 sys.path.insert(0, './pkg-python')
 
-from streamguard import GuardEngine, ForbiddenSequenceRule, PatternRule
+from streamguard import Decision, GuardEngine, ForbiddenSequenceRule, PatternRule
 
 # LangChain imports (optional - examples gracefully handle missing dependencies)
 try:
@@ -31,10 +37,143 @@ except ImportError:
     print("   Running with simulated streaming instead.\n")
 
 
+@lru_cache(maxsize=None)
+def _chunker(size):
+    """Build (once per size) a chunking generator with size inlined
+
+    The size is a literal in the generated code, so the loop does no
+    lookups for it on each step. Callers pass a plain int (see
+    simulate_streaming_response), so the cache has one entry per size.
+    """
+    if size <= 0:
+        raise ValueError(f"chunk_size must be positive, got {size!r}")
+
+    src = (
+        "def chunks(text):\n"
+        f"    for i in range(0, len(text), {size}):\n"
+        f"        yield text[i:i + {size}]\n"
+    )
+    namespace = {}
+    exec(src, namespace)
+    return namespace['chunks']
+
+
 def simulate_streaming_response(text, chunk_size=5):
     """Simulate LLM streaming by yielding text chunks"""
-    for i in range(0, len(text), chunk_size):
-        yield text[i:i + chunk_size]
+    return _chunker(operator.index(chunk_size))(text)
+
+
+def simulate_streaming_bytes(text, chunk_size=5):
+    """Simulate LLM streaming as (buffer, start, end) spans over one encoding
+
+    The text is encoded once; each chunk is just a pair of offsets for
+    GuardEngine.feed_bytes, so no per-chunk string is created. Span ends are
+    moved forward to the next character boundary so multi-byte characters
+    are never split.
+    """
+    size = operator.index(chunk_size)
+    if size <= 0:
+        raise ValueError(f"chunk_size must be positive, got {chunk_size!r}")
+
+    buf = text.encode('utf-8')
+    start = 0
+    while start < len(buf):
+        end = min(start + size, len(buf))
+        while end < len(buf) and (buf[end] & 0xC0) == 0x80:
+            end += 1
+        yield buf, start, end
+        start = end
+
+
+async def guarded_astream(llm_astream, guard, offload_min_len=64 * 1024):
+    """Async generator applying guardrails to an async LLM stream
+
+    Accepts plain strings or LangChain message chunks (``chunk.content``).
+    Token-sized chunks are scanned inline on the event loop thread: that
+    takes about a microsecond, far less than a thread-pool hand-off.
+    Chunks of at least ``offload_min_len`` characters (e.g. a whole document
+    from a model that does not stream tokens) are scanned on the default
+    executor via ``feed_many``, which releases the GIL, so the loop keeps
+    serving other tasks meanwhile. Use one engine per stream.
+
+    Yields ``(chunk, decision)`` pairs and stops after the first block or
+    rewrite.
+    """
+    loop = asyncio.get_running_loop()
+    async for chunk in llm_astream:
+        content = getattr(chunk, 'content', chunk)
+        if not content:
+            continue
+
+        if len(content) < offload_min_len:
+            decision = guard.feed(content)
+        else:
+            [decision] = await loop.run_in_executor(None, guard.feed_many, [content])
+        yield content, decision
+        if decision.kind != Decision.ALLOW:
+            break
+
+
+_STREAM_END = object()
+
+
+class _ProducerError:
+    """Wraps an exception raised while draining the LLM stream"""
+
+    def __init__(self, exc):
+        self.exc = exc
+
+
+def guarded_stream_threaded(llm_iter, guard, maxsize=32):
+    """Apply guardrails while a background thread drains the LLM stream
+
+    A producer thread pulls chunks from ``llm_iter`` (usually blocked on
+    network I/O) into a bounded queue, while this generator feeds them to
+    the guard. Blocking network reads release the GIL, so waiting for the
+    network and scanning overlap instead of adding up.
+
+    Yields ``(chunk, decision)`` pairs and stops after the first block or
+    rewrite. Errors raised by ``llm_iter`` are re-raised here.
+    """
+    chunks = queue.Queue(maxsize)
+    stop = threading.Event()
+
+    def put(item):
+        # Give up if the consumer stopped early, instead of blocking on a full queue
+        while not stop.is_set():
+            try:
+                chunks.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce():
+        try:
+            for chunk in llm_iter:
+                if not put(chunk):
+                    return
+        except Exception as exc:
+            put(_ProducerError(exc))
+        finally:
+            put(_STREAM_END)
+
+    producer = threading.Thread(target=produce, daemon=True)
+    producer.start()
+    try:
+        while True:
+            item = chunks.get()
+            if item is _STREAM_END:
+                break
+            if isinstance(item, _ProducerError):
+                raise item.exc
+
+            decision = guard.feed(item)
+            yield item, decision
+            if decision.kind != Decision.ALLOW:
+                break
+    finally:
+        stop.set()
 
 
 def example1_basic_streaming_with_guardrails():
@@ -58,27 +197,21 @@ def example1_basic_streaming_with_guardrails():
     print(f"  {llm_response}\n")
     
     print("Streaming with guardrails:")
-    output = ""
-    blocked = False
-    rewritten = False
-    
-    for chunk in simulate_streaming_response(llm_response, chunk_size=8):
-        decision = guard.feed(chunk)
-        
-        if decision.is_allow():
-            output += chunk
-            print(chunk, end='', flush=True)
-        elif decision.is_rewrite():
-            output = decision.rewritten_text()
-            print(f'\n[Rewritten: {output}]')
-            rewritten = True
-            break
-        elif decision.is_block():
-            print(f'\n🚫 Stream blocked: {decision.reason()}')
-            blocked = True
-            break
-    
-    if not blocked and not rewritten:
+
+    # Scan the whole stream in one call; allowed chunks land in `buf`
+    chunks = list(simulate_streaming_response(llm_response, chunk_size=8))
+    buf = bytearray()
+    decision, _ = guard.stream_into(chunks, buf)
+    output = buf.decode('utf-8')
+    print(output, end='', flush=True)
+
+    kind = decision.kind
+    if kind == Decision.REWRITE:
+        output = decision.rewritten_text()
+        print(f'\n[Rewritten: {output}]')
+    elif kind == Decision.BLOCK:
+        print(f'\n🚫 Stream blocked: {decision.reason()}')
+    else:
         print(f'\n✓ Complete output: {output}')
 
 
@@ -96,7 +229,8 @@ def example2_callback_handler():
         def __init__(self, guard_engine):
             super().__init__()
             self.guard = guard_engine
-            self.output_buffer = []
+            # Tokens are written into one growing buffer; no join at the end
+            self.output_buffer = io.StringIO()
             self.blocked = False
             self.block_reason = None
             
@@ -107,15 +241,16 @@ def example2_callback_handler():
             
             decision = self.guard.feed(token)
             
-            if decision.is_allow():
-                self.output_buffer.append(token)
+            kind = decision.kind
+            if kind == Decision.ALLOW:
+                self.output_buffer.write(token)
                 print(token, end='', flush=True)
-            elif decision.is_rewrite():
+            elif kind == Decision.REWRITE:
                 # Handle rewrite by replacing entire output
-                rewritten = decision.rewritten_text()
-                self.output_buffer = [rewritten]
+                self.output_buffer = io.StringIO()
+                self.output_buffer.write(decision.rewritten_text())
                 print(f'\n[Content rewritten]')
-            elif decision.is_block():
+            elif kind == Decision.BLOCK:
                 self.blocked = True
                 self.block_reason = decision.reason()
                 print(f'\n🚫 Stream blocked: {self.block_reason}')
@@ -125,7 +260,7 @@ def example2_callback_handler():
             """Get the filtered output"""
             if self.blocked:
                 return None, self.block_reason
-            return ''.join(self.output_buffer), None
+            return self.output_buffer.getvalue(), None
     
     # Setup guardrails
     guard = GuardEngine()
@@ -159,13 +294,14 @@ def example3_streaming_chain_with_guardrails():
         for chunk in llm_stream:
             decision = guard_engine.feed(chunk)
             
-            if decision.is_allow():
+            kind = decision.kind
+            if kind == Decision.ALLOW:
                 yield chunk
-            elif decision.is_rewrite():
+            elif kind == Decision.REWRITE:
                 # Yield rewritten content and stop
                 yield decision.rewritten_text()
                 break
-            elif decision.is_block():
+            elif kind == Decision.BLOCK:
                 # Yield error and stop
                 yield f"[BLOCKED: {decision.reason()}]"
                 break
@@ -226,11 +362,8 @@ def example4_rag_pipeline_with_guardrails():
     
     print("1. Filtering retrieved documents:")
     safe_docs = []
-    for doc in documents:
-        doc_guard.reset()
-        decision = doc_guard.feed(doc)
-        
-        if decision.is_allow():
+    for doc, decision in zip(documents, doc_guard.scan_batch(documents)):
+        if decision.kind == Decision.ALLOW:
             safe_docs.append(doc)
             print(f"  ✓ {doc}")
         else:
@@ -248,14 +381,15 @@ def example4_rag_pipeline_with_guardrails():
     for chunk in simulate_streaming_response(llm_response, chunk_size=10):
         decision = output_guard.feed(chunk)
         
-        if decision.is_allow():
+        kind = decision.kind
+        if kind == Decision.ALLOW:
             final_output += chunk
             print(chunk, end='', flush=True)
-        elif decision.is_rewrite():
+        elif kind == Decision.REWRITE:
             final_output = decision.rewritten_text()
             print(f'\n[Rewritten]')
             break
-        elif decision.is_block():
+        elif kind == Decision.BLOCK:
             print(f'\n🚫 Blocked: {decision.reason()}')
             break
     
@@ -299,23 +433,25 @@ def example5_multi_rule_scoring():
     print(f"Score threshold: 100\n")
     print("Processing stream:")
     
-    output = ""
+    # Collect the trace and print it once instead of one print per chunk
+    trace = []
     blocked = False
-    for chunk in simulate_streaming_response(response, chunk_size=12):
-        decision = guard.feed(chunk)
+    # Stream offsets into one encoded buffer; feed_bytes scans each span in
+    # place, and the trace reports offsets so no chunk is ever decoded
+    for buf, start, end in simulate_streaming_bytes(response, chunk_size=12):
+        decision = guard.feed_bytes(buf, start, end)
         score = guard.current_score()
         
-        print(f"  Chunk: '{chunk}' → Score: {score}")
+        trace.append(f"  Bytes {start}-{end} → Score: {score}")
         
-        if decision.is_block():
-            print(f"🚫 Blocked at score {score}: {decision.reason()}")
+        if decision.kind == Decision.BLOCK:
+            trace.append(f"🚫 Blocked at score {score}: {decision.reason()}")
             blocked = True
             break
-        
-        output += chunk
     
     if not blocked:
-        print(f"✓ Allowed with score {guard.current_score()}")
+        trace.append(f"✓ Allowed with score {guard.current_score()}")
+    print("\n".join(trace))
 
 
 def example6_real_openai_integration():
@@ -348,31 +484,33 @@ def example6_real_openai_integration():
         print(f"Prompt: {prompt}\n")
         print("Streaming response with guardrails:")
         
+        def stream_text():
+            for chunk in llm.stream(prompt):
+                # Extract content from LangChain chunk - handles different chunk types
+                if hasattr(chunk, 'content'):
+                    content = chunk.content
+                elif isinstance(chunk, str):
+                    content = chunk
+                else:
+                    # Skip unsupported chunk types
+                    continue
+
+                # Skip empty chunks
+                if content:
+                    yield content
+
+        # Network reads run on a producer thread while the guard scans
         output = ""
-        for chunk in llm.stream(prompt):
-            # Extract content from LangChain chunk - handles different chunk types
-            if hasattr(chunk, 'content'):
-                content = chunk.content
-            elif isinstance(chunk, str):
-                content = chunk
-            else:
-                # Skip unsupported chunk types
-                continue
-            
-            # Skip empty chunks
-            if not content:
-                continue
-            
-            decision = guard.feed(content)
-            
-            if decision.is_allow():
+        for content, decision in guarded_stream_threaded(stream_text(), guard):
+            kind = decision.kind
+            if kind == Decision.ALLOW:
                 output += content
                 print(content, end='', flush=True)
-            elif decision.is_rewrite():
+            elif kind == Decision.REWRITE:
                 output = decision.rewritten_text()
                 print(f'\n[Rewritten: {output}]')
                 break
-            elif decision.is_block():
+            elif kind == Decision.BLOCK:
                 print(f'\n🚫 Blocked: {decision.reason()}')
                 break
         
@@ -386,48 +524,41 @@ def example6_real_openai_integration():
 
 
 def example7_async_streaming():
-    """Example 7: Async streaming pattern (conceptual)"""
-    print('\n=== Example 7: Async Streaming Pattern (Conceptual) ===')
-    
-    print("""
-This example demonstrates the pattern for async/await integration:
+    """Example 7: Async streaming with guardrails"""
+    print('\n=== Example 7: Async Streaming with Guardrails ===')
 
-```python
-import asyncio
-from langchain_openai import ChatOpenAI
-from streamguard import GuardEngine, PatternRule
+    async def simulated_astream(text, chunk_size=6):
+        """Stand-in for llm.astream(prompt): yields chunks with network delay"""
+        for chunk in simulate_streaming_response(text, chunk_size):
+            await asyncio.sleep(0.01)
+            yield chunk
 
-async def guarded_async_stream(llm, prompt, guard):
-    async for chunk in llm.astream(prompt):
-        decision = guard.feed(chunk.content)
-        
-        if decision.is_allow():
-            yield chunk.content
-        elif decision.is_rewrite():
-            yield decision.rewritten_text()
-            break
-        elif decision.is_block():
-            yield f"[BLOCKED: {decision.reason()}]"
-            break
+    async def run_stream(name, text):
+        # Each concurrent stream needs its own engine
+        guard = GuardEngine()
+        guard.add_pattern_rule(PatternRule.email_rewrite('[EMAIL]'))
 
-async def main():
-    guard = GuardEngine()
-    guard.add_pattern_rule(PatternRule.email_rewrite('[EMAIL]'))
-    
-    llm = ChatOpenAI(streaming=True)
-    
-    async for chunk in guarded_async_stream(llm, "Hello!", guard):
-        print(chunk, end='', flush=True)
+        # With LangChain: guarded_astream(llm.astream(prompt), guard)
+        output = ""
+        async for content, decision in guarded_astream(simulated_astream(text), guard):
+            kind = decision.kind
+            if kind == Decision.ALLOW:
+                output += content
+            elif kind == Decision.REWRITE:
+                output = decision.rewritten_text()
+            elif kind == Decision.BLOCK:
+                output += f"[BLOCKED: {decision.reason()}]"
+        return name, output
 
-# Run with: asyncio.run(main())
-```
+    async def main():
+        # Both streams share one event loop without blocking each other
+        return await asyncio.gather(
+            run_stream('stream-1', "Hello! Reach our team at team@example.com anytime."),
+            run_stream('stream-2', "Thanks for asking, the docs cover everything you need."),
+        )
 
-Key points:
-- StreamGuard is synchronous (deterministic, zero-copy)
-- Easily wraps in async generators
-- No blocking operations in guardrail checks
-- Suitable for FastAPI, async LangChain chains
-""")
+    for name, output in asyncio.run(main()):
+        print(f'  {name}: {output}')
 
 
 # Main execution
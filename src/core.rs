@@ -1,5 +1,6 @@
 //! Core types and traits for StreamGuard
 
+use alloc::boxed::Box;
 use alloc::string::String;
 use alloc::vec::Vec;
 
@@ -103,6 +104,15 @@ pub trait Rule: Send + Sync {
     fn last_score(&self) -> u32 {
         0
     }
+
+    /// Optional: Create an independent copy of this rule in its reset state
+    ///
+    /// Compiled matchers should be shared with the original rather than
+    /// rebuilt. Used by the engine to scan independent documents in
+    /// parallel. Returns `None` (the default) if the rule cannot be forked.
+    fn fork(&self) -> Option<Box<dyn Rule>> {
+        None
+    }
 }
 
 #[cfg(test)]
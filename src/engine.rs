@@ -1,5 +1,6 @@
 //! The main GuardEngine that orchestrates rules and decisions
 
+use alloc::borrow::Cow;
 use alloc::boxed::Box;
 use alloc::format;
 use alloc::string::{String, ToString};
@@ -34,7 +35,11 @@ pub enum RewriteMode {
 /// let decision = engine.feed("chunk of text");
 /// ```
 pub struct GuardEngine {
+    // Per-rule data is stored as parallel arrays indexed by rule position,
+    // so the score pass reads one contiguous `u32` slice
     rules: Vec<Box<dyn Rule>>,
+    rule_names: Vec<String>,
+    rule_scores: Vec<u32>,
     stopped: bool,
     score_threshold: Option<u32>,
     current_score: u32,
@@ -48,6 +53,8 @@ impl GuardEngine {
     pub fn new() -> Self {
         Self {
             rules: Vec::new(),
+            rule_names: Vec::new(),
+            rule_scores: Vec::new(),
             stopped: false,
             score_threshold: None,
             current_score: 0,
@@ -86,6 +93,8 @@ impl GuardEngine {
     /// Rules are evaluated in the order they are added.
     /// The first rule to return a non-Allow decision wins.
     pub fn add_rule(&mut self, rule: Box<dyn Rule>) {
+        self.rule_names.push(rule.name().to_string());
+        self.rule_scores.push(0);
         self.rules.push(rule);
     }
 
@@ -119,29 +128,24 @@ impl GuardEngine {
             return Decision::Allow;
         }
 
-        // Track scores and rewrites for this chunk
-        let mut chunk_score = 0u32;
-        let mut text = chunk.to_string();
+        // Track rewrites for this chunk
+        // The chunk is only copied once a chained rewrite replaces it
+        let mut text: Cow<'_, str> = Cow::Borrowed(chunk);
         let mut has_rewrite = false;
         let mut first_block: Option<Decision> = None;
         self.score_details.clear();
 
+        // In scoring mode (threshold or decay configured), don't stop on individual blocks
+        let scoring_mode = self.score_threshold.is_some() || self.score_decay > 0.0;
+
         // Evaluate ALL rules to accumulate scores
-        for rule in &mut self.rules {
+        for (rule, rule_score) in self.rules.iter_mut().zip(self.rule_scores.iter_mut()) {
             let decision = rule.feed(&text);
-            let rule_score = rule.last_score();
-            
-            // Always accumulate scores from all rules
-            if rule_score > 0 {
-                chunk_score += rule_score;
-                self.score_details.push((rule.name().to_string(), rule_score));
-            }
+            *rule_score = rule.last_score();
 
             match decision {
                 Decision::Allow => continue,
                 Decision::Block { .. } => {
-                    // In scoring mode (threshold or decay configured), don't stop on individual blocks
-                    let scoring_mode = self.score_threshold.is_some() || self.score_decay > 0.0;
                     if !scoring_mode && first_block.is_none() {
                         first_block = Some(decision);
                     }
@@ -149,7 +153,7 @@ impl GuardEngine {
                 Decision::Rewrite { replacement } => {
                     if self.rewrite_mode == RewriteMode::Chain {
                         // Chain mode: apply rewrite and continue to next rule
-                        text = replacement;
+                        text = Cow::Owned(replacement);
                         has_rewrite = true;
                     } else if first_block.is_none() {
                         // First-wins mode: remember first rewrite, but continue evaluating
@@ -159,8 +163,23 @@ impl GuardEngine {
             }
         }
 
+        // Always accumulate scores from all rules
+        // The per-rule scores are summed in u64, a plain widening add that the
+        // compiler vectorizes (a saturating u32 fold is a serial dependency
+        // chain). The total is then pinned at u32::MAX instead of overflowing,
+        // and the threshold is compared once per chunk rather than per match
+        let chunk_total: u64 = self.rule_scores.iter().map(|&score| u64::from(score)).sum();
+        let chunk_score = u32::try_from(chunk_total).unwrap_or(u32::MAX);
+        if chunk_score > 0 {
+            for (name, &score) in self.rule_names.iter().zip(&self.rule_scores) {
+                if score > 0 {
+                    self.score_details.push((name.clone(), score));
+                }
+            }
+        }
+
         // Update score after evaluating all rules
-        self.current_score += chunk_score;
+        self.current_score = self.current_score.saturating_add(chunk_score);
 
         // Apply score decay if configured (only if no new scores this chunk)
         if self.score_decay > 0.0 && chunk_score == 0 && self.current_score > 0 {
@@ -185,12 +204,176 @@ impl GuardEngine {
 
         // Return chained rewrite if any rewrites occurred
         if has_rewrite {
-            Decision::Rewrite { replacement: text }
+            Decision::Rewrite {
+                replacement: text.into_owned(),
+            }
         } else {
             Decision::Allow
         }
     }
 
+    /// Process a sequence of chunks in a single call
+    ///
+    /// Feeds each chunk in order and collects the decisions. Processing
+    /// stops after the first non-Allow decision, mirroring a streaming
+    /// loop that breaks on block or rewrite, so the last element of the
+    /// returned vector is the decision that ended the stream (if any).
+    ///
+    /// This is mainly useful for bindings, where it collapses one
+    /// boundary crossing per chunk into a single call.
+    pub fn feed_many<I, S>(&mut self, chunks: I) -> Vec<Decision>
+    where
+        I: IntoIterator<Item = S>,
+        S: AsRef<str>,
+    {
+        let mut decisions = Vec::new();
+        for chunk in chunks {
+            let decision = self.feed(chunk.as_ref());
+            let done = !decision.is_allow();
+            decisions.push(decision);
+            if done {
+                break;
+            }
+        }
+        decisions
+    }
+
+    /// Stream chunks into `out`, appending each allowed chunk as it is scanned
+    ///
+    /// Fuses the usual "feed, check the decision, append" loop into one
+    /// call. Processing stops at the first block or rewrite. Returns that
+    /// decision, or `Decision::Allow` if every chunk passed, together with
+    /// the number of chunks appended to `out`. A rewritten or blocked chunk
+    /// is never appended, so callers decide how to replace the output.
+    pub fn stream_into<I, S>(&mut self, chunks: I, out: &mut String) -> (Decision, usize)
+    where
+        I: IntoIterator<Item = S>,
+        S: AsRef<str>,
+    {
+        let mut written = 0;
+        for chunk in chunks {
+            let chunk = chunk.as_ref();
+            let decision = self.feed(chunk);
+            if !decision.is_allow() {
+                return (decision, written);
+            }
+            out.push_str(chunk);
+            written += 1;
+        }
+        (Decision::Allow, written)
+    }
+
+    /// Create a fresh engine with the same configuration and rules
+    ///
+    /// Rules are forked in their reset state and share compiled matchers
+    /// with this engine. Returns `None` if any rule does not support forking.
+    pub fn fork(&self) -> Option<GuardEngine> {
+        let mut rules = Vec::with_capacity(self.rules.len());
+        for rule in &self.rules {
+            rules.push(rule.fork()?);
+        }
+
+        Some(Self {
+            rules,
+            rule_names: self.rule_names.clone(),
+            rule_scores: alloc::vec![0; self.rule_scores.len()],
+            stopped: false,
+            score_threshold: self.score_threshold,
+            current_score: 0,
+            score_decay: self.score_decay,
+            rewrite_mode: self.rewrite_mode,
+            score_details: Vec::new(),
+        })
+    }
+
+    /// Scan one complete document as its own stream
+    ///
+    /// Equivalent to `reset()` followed by `feed(doc)`, in a single call.
+    /// Any state left over from earlier input is discarded first; the state
+    /// after scanning `doc` is kept, so callers may inspect `current_score()`.
+    pub fn scan_independent(&mut self, doc: &str) -> Decision {
+        self.reset();
+        self.feed(doc)
+    }
+
+    /// Scan a batch of independent documents
+    ///
+    /// Each document is treated as a complete stream of its own: the engine
+    /// is reset before every document and the decision for feeding the whole
+    /// document is returned, in input order. The engine is left in its reset
+    /// state afterwards.
+    ///
+    /// With `parallel` set (and the `std` feature enabled), large batches are
+    /// split across worker threads, each using a forked copy of the engine.
+    /// If any rule cannot be forked, the batch is scanned on the calling
+    /// thread. Results are identical either way.
+    pub fn scan_batch<S>(&mut self, docs: &[S], parallel: bool) -> Vec<Decision>
+    where
+        S: AsRef<str> + Sync,
+    {
+        #[cfg(feature = "std")]
+        if parallel {
+            if let Some(decisions) = self.scan_batch_parallel(docs) {
+                return decisions;
+            }
+        }
+        #[cfg(not(feature = "std"))]
+        let _ = parallel;
+
+        let decisions = docs
+            .iter()
+            .map(|doc| self.scan_independent(doc.as_ref()))
+            .collect();
+        self.reset();
+        decisions
+    }
+
+    /// Scan a batch on worker threads, or return `None` to fall back to serial
+    #[cfg(feature = "std")]
+    fn scan_batch_parallel<S>(&mut self, docs: &[S]) -> Option<Vec<Decision>>
+    where
+        S: AsRef<str> + Sync,
+    {
+        /// Batches smaller than this are not worth spawning threads for
+        const PARALLEL_MIN_DOCS: usize = 64;
+
+        if docs.len() < PARALLEL_MIN_DOCS {
+            return None;
+        }
+
+        let workers = std::thread::available_parallelism()
+            .map(|n| n.get())
+            .unwrap_or(1)
+            .min(docs.len());
+        if workers < 2 {
+            return None;
+        }
+
+        let mut engines = Vec::with_capacity(workers);
+        for _ in 0..workers {
+            engines.push(self.fork()?);
+        }
+
+        let per_worker = docs.len().div_ceil(workers);
+        let decisions = std::thread::scope(|scope| {
+            let handles: Vec<_> = docs
+                .chunks(per_worker)
+                .zip(engines)
+                .map(|(slice, mut engine)| {
+                    scope.spawn(move || engine.scan_batch(slice, false))
+                })
+                .collect();
+
+            handles
+                .into_iter()
+                .flat_map(|handle| handle.join().expect("scan_batch worker panicked"))
+                .collect()
+        });
+
+        self.reset();
+        Some(decisions)
+    }
+
     /// Reset the engine and all rules
     ///
     /// This clears the stopped state and resets all rule internal state.
@@ -199,6 +382,7 @@ impl GuardEngine {
         self.stopped = false;
         self.current_score = 0;
         self.score_details.clear();
+        self.rule_scores.fill(0);
         for rule in &mut self.rules {
             rule.reset();
         }
@@ -322,4 +506,56 @@ mod tests {
 
         assert_eq!(engine.feed(""), Decision::Allow);
     }
+
+    #[test]
+    fn test_feed_many_stops_on_first_decision() {
+        let mut engine = GuardEngine::new();
+        engine.add_rule(Box::new(TestBlockRule::new()));
+
+        let decisions = engine.feed_many(["good ", "bad ", "never fed"]);
+        assert_eq!(decisions.len(), 2);
+        assert!(decisions[0].is_allow());
+        assert!(decisions[1].is_block());
+    }
+
+    #[test]
+    fn test_feed_many_all_allowed() {
+        let mut engine = GuardEngine::new();
+        engine.add_rule(Box::new(TestBlockRule::new()));
+
+        let decisions = engine.feed_many(vec!["good ".to_string(), "text".to_string()]);
+        assert_eq!(decisions, vec![Decision::Allow, Decision::Allow]);
+    }
+
+    #[test]
+    fn test_stream_into_appends_allowed_chunks() {
+        let mut engine = GuardEngine::new();
+        engine.add_rule(Box::new(TestBlockRule::new()));
+
+        let mut out = String::from("> ");
+        let (decision, written) = engine.stream_into(["good ", "text ", "bad ", "never fed"], &mut out);
+        assert!(decision.is_block());
+        assert_eq!(written, 2);
+        assert_eq!(out, "> good text ");
+
+        engine.reset();
+        out.clear();
+        let (decision, written) = engine.stream_into(["all ", "good"], &mut out);
+        assert!(decision.is_allow());
+        assert_eq!(written, 2);
+        assert_eq!(out, "all good");
+    }
+
+    #[test]
+    fn test_scan_independent_discards_previous_state() {
+        let mut engine = GuardEngine::new();
+        engine.add_rule(Box::new(TestBlockRule::new()));
+
+        assert!(engine.feed("bad").is_block());
+        assert!(engine.is_stopped());
+
+        // A blocked earlier stream does not affect the next document
+        assert!(engine.scan_independent("good").is_allow());
+        assert!(engine.scan_independent("bad").is_block());
+    }
 }
@@ -2,7 +2,9 @@
 //! 
 //! Provides native Python extension with zero-copy performance
 
+use pyo3::exceptions::{PyRuntimeError, PyValueError};
 use pyo3::prelude::*;
+use pyo3::types::{PyByteArray, PyByteArrayMethods};
 use alloc::boxed::Box;
 use alloc::string::{String, ToString};
 use alloc::vec::Vec;
@@ -21,14 +23,42 @@ pub struct PyDecision {
 
 #[pymethods]
 impl PyDecision {
+    /// `kind` value of an allow decision
+    #[classattr]
+    const ALLOW: u8 = 0;
+
+    /// `kind` value of a rewrite decision
+    #[classattr]
+    const REWRITE: u8 = 1;
+
+    /// `kind` value of a block decision
+    #[classattr]
+    const BLOCK: u8 = 2;
+
+    /// Decision kind as an int: `ALLOW` (0), `REWRITE` (1) or `BLOCK` (2).
+    ///
+    /// A single attribute read; compare it against the class constants
+    /// instead of calling the `is_*` methods one after another.
+    #[getter]
+    fn kind(&self) -> u8 {
+        match self.inner {
+            Decision::Allow => Self::ALLOW,
+            Decision::Rewrite { .. } => Self::REWRITE,
+            Decision::Block { .. } => Self::BLOCK,
+        }
+    }
+
+    /// Deprecated: use `kind == Decision.ALLOW`.
     fn is_allow(&self) -> bool {
         matches!(self.inner, Decision::Allow)
     }
     
+    /// Deprecated: use `kind == Decision.BLOCK`.
     fn is_block(&self) -> bool {
         matches!(self.inner, Decision::Block { .. })
     }
     
+    /// Deprecated: use `kind == Decision.REWRITE`.
     fn is_rewrite(&self) -> bool {
         matches!(self.inner, Decision::Rewrite { .. })
     }
@@ -197,12 +227,120 @@ impl PyGuardEngine {
         self.inner.add_rule(Box::new(actual_rule));
     }
     
+    /// Feed one chunk.
+    ///
+    /// The GIL is kept: scanning a single chunk costs less than releasing and
+    /// re-acquiring it, and holding it serializes threads sharing an engine.
     fn feed(&mut self, chunk: &str) -> PyDecision {
         PyDecision {
             inner: self.inner.feed(chunk),
         }
     }
     
+    /// Feed the UTF-8 bytes `data[start:end]`.
+    ///
+    /// Lets callers encode a response once and stream it as offsets into a
+    /// single `bytes` object, instead of creating a `str` per chunk. Raises
+    /// `ValueError` if the span is out of range or not valid UTF-8 (e.g. it
+    /// splits a multi-byte character). Like `feed`, this keeps the GIL.
+    fn feed_bytes(&mut self, data: &[u8], start: usize, end: usize) -> PyResult<PyDecision> {
+        if start > end || end > data.len() {
+            return Err(PyValueError::new_err(alloc::format!(
+                "span {}..{} out of range for buffer of length {}",
+                start, end, data.len()
+            )));
+        }
+        core::str::from_utf8(&data[start..end])
+            .map(|chunk| PyDecision { inner: self.inner.feed(chunk) })
+            .map_err(|e| PyValueError::new_err(alloc::format!("invalid UTF-8 in span: {}", e)))
+    }
+
+    /// Feed a list of chunks in one call, releasing the GIL while scanning.
+    ///
+    /// Stops after the first block or rewrite; the last decision in the
+    /// returned list is the one that ended the stream (if any).
+    ///
+    /// The engine stays mutably borrowed while the GIL is released, so it must
+    /// not be used from another thread during this call (PyO3 raises
+    /// `RuntimeError: Already borrowed`). Use one engine per thread.
+    fn feed_many(&mut self, py: Python<'_>, chunks: Vec<String>) -> Vec<PyDecision> {
+        let decisions = py.detach(|| self.inner.feed_many(&chunks));
+        decisions
+            .into_iter()
+            .map(|inner| PyDecision { inner })
+            .collect()
+    }
+
+    /// Stream chunks into a `bytearray`, appending the UTF-8 bytes of each
+    /// allowed chunk, and stop at the first block or rewrite.
+    ///
+    /// Returns `(decision, count)`: the decision that ended the stream (an
+    /// allow decision if every chunk passed) and the number of chunks written.
+    /// Scanning runs with the GIL released. `out` is grown to fit every chunk
+    /// before any is scanned, so if it cannot be resized (e.g. a memoryview of
+    /// it is alive) the error is raised with the engine untouched; it is then
+    /// trimmed to the safe text. `out` must not be touched by other threads
+    /// during the call.
+    ///
+    /// The engine stays mutably borrowed while the GIL is released, so it must
+    /// not be used from another thread during this call (PyO3 raises
+    /// `RuntimeError: Already borrowed`). Use one engine per thread.
+    fn stream_into(
+        &mut self,
+        py: Python<'_>,
+        chunks: Vec<String>,
+        out: &Bound<'_, PyByteArray>,
+    ) -> PyResult<(PyDecision, usize)> {
+        // Reserve room for the worst case (every chunk allowed) up front, so a
+        // failing resize is reported before the engine consumes any chunk
+        let start = out.len();
+        let capacity: usize = chunks.iter().map(String::len).sum();
+        out.resize(start + capacity)?;
+
+        let mut safe = String::with_capacity(capacity);
+        let (inner, written) = py.detach(|| self.inner.stream_into(&chunks, &mut safe));
+
+        // Another thread may have touched `out` while the GIL was released
+        if out.len() != start + capacity {
+            return Err(PyRuntimeError::new_err("bytearray was resized during stream_into"));
+        }
+        // SAFETY: we hold the GIL and run no Python code while the slice is
+        // alive, so nothing else can resize or read the bytearray meanwhile.
+        unsafe {
+            out.as_bytes_mut()[start..start + safe.len()].copy_from_slice(safe.as_bytes());
+        }
+        out.resize(start + safe.len())?;
+
+        Ok((PyDecision { inner }, written))
+    }
+
+    /// Scan one complete document as its own stream.
+    ///
+    /// Same as `reset()` followed by `feed(doc)`, in one call. Like `feed`,
+    /// this keeps the GIL, so a shared engine serves one caller at a time.
+    fn scan_independent(&mut self, doc: &str) -> PyDecision {
+        PyDecision {
+            inner: self.inner.scan_independent(doc),
+        }
+    }
+
+    /// Scan a list of independent documents, releasing the GIL while scanning.
+    ///
+    /// Each document is scanned as its own stream (as if `reset()` were called
+    /// before it). With `parallel=True`, large batches are split across threads.
+    ///
+    /// The engine stays mutably borrowed while the GIL is released, so it must
+    /// not be used from another thread during this call (PyO3 raises
+    /// `RuntimeError: Already borrowed`). Use one engine per thread.
+    #[pyo3(signature = (docs, parallel = true))]
+    fn scan_batch(&mut self, py: Python<'_>, docs: Vec<String>, parallel: bool) -> Vec<PyDecision> {
+        let decisions = py.detach(|| self.inner.scan_batch(&docs, parallel));
+        decisions
+            .into_iter()
+            .map(|inner| PyDecision { inner })
+            .collect()
+    }
+
     fn reset(&mut self) {
         self.inner.reset();
     }
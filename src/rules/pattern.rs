@@ -23,6 +23,8 @@
 //! A full DFA-based regex engine could be added as an optional feature
 //! (see TODO.md), but the current implementation satisfies the core requirements.
 
+use alloc::borrow::Cow;
+use alloc::boxed::Box;
 use alloc::string::{String, ToString};
 use alloc::vec::Vec;
 
@@ -81,33 +83,85 @@ impl PatternPreset {
     }
 }
 
+/// Hand-coded matcher selected for a pattern configuration
+///
+/// Resolved once when the configuration is created so that `feed` does not
+/// have to re-inspect the description on every chunk.
+#[derive(Debug, Clone, Copy, PartialEq, Eq)]
+enum MatcherKind {
+    Email,
+    Url,
+    Ipv4,
+    CreditCard,
+    /// Plain substring search for custom patterns
+    Literal,
+}
+
+impl MatcherKind {
+    /// Select the matcher from a description (same rules as the preset descriptions)
+    fn from_description(description: &str) -> Self {
+        if description.contains("email") {
+            MatcherKind::Email
+        } else if description.contains("URL") {
+            MatcherKind::Url
+        } else if description.contains("IPv4") {
+            MatcherKind::Ipv4
+        } else if description.contains("credit card") {
+            MatcherKind::CreditCard
+        } else {
+            MatcherKind::Literal
+        }
+    }
+
+    /// Cheap prefilter: can `text` contain a byte that every match requires?
+    ///
+    /// Each hand-coded matcher needs a specific byte to succeed ('@' for
+    /// emails, the ':' of "://" for URLs, '.' for IPv4, a digit for card
+    /// numbers). Checking for it in the newly fed chunk is a single byte scan,
+    /// which lets `feed` skip re-running the full matcher over the whole
+    /// buffer for chunks that cannot complete a match. None of the trigger
+    /// bytes are letters, so case folding does not affect the check.
+    fn may_match(self, text: &str) -> bool {
+        let bytes = text.as_bytes();
+        match self {
+            MatcherKind::Email => bytes.contains(&b'@'),
+            MatcherKind::Url => bytes.contains(&b':'),
+            MatcherKind::Ipv4 => bytes.contains(&b'.'),
+            MatcherKind::CreditCard => bytes.iter().any(u8::is_ascii_digit),
+            MatcherKind::Literal => true,
+        }
+    }
+}
+
 /// Configuration for pattern matching
 #[derive(Debug, Clone)]
 pub struct PatternConfig {
     /// The pattern to match (simple regex-like)
-    pattern: String,
-    /// Human-readable description
-    description: String,
+    pattern: Cow<'static, str>,
     /// Whether to use case-insensitive matching
     case_insensitive: bool,
+    /// Matcher resolved from the description, which is not needed after construction
+    kind: MatcherKind,
 }
 
 impl PatternConfig {
     /// Create a new pattern configuration from a preset
+    ///
+    /// Preset strings are static, so this does not allocate.
     pub fn from_preset(preset: PatternPreset) -> Self {
         Self {
-            pattern: preset.pattern().to_string(),
-            description: preset.description().to_string(),
+            pattern: Cow::Borrowed(preset.pattern()),
             case_insensitive: false,
+            kind: MatcherKind::from_description(preset.description()),
         }
     }
 
     /// Create a custom pattern configuration
     pub fn custom(pattern: &str, description: &str) -> Self {
         Self {
-            pattern: pattern.to_string(),
-            description: description.to_string(),
+            pattern: Cow::Owned(pattern.to_string()),
             case_insensitive: false,
+            kind: MatcherKind::from_description(description),
         }
     }
 
@@ -156,11 +210,14 @@ impl PatternConfig {
 ///     "US phone number"
 /// );
 /// ```
+#[derive(Clone)]
 pub struct PatternRule {
     /// Pattern configuration
     config: PatternConfig,
     /// Buffer for accumulating text across chunks
     buffer: String,
+    /// Whether the buffer holds the matcher's trigger byte (see `MatcherKind::may_match`)
+    armed: bool,
     /// Reason to return when blocking
     reason: String,
     /// Replacement text for rewrites (None = block mode)
@@ -173,6 +230,7 @@ impl PatternRule {
         Self {
             config: PatternConfig::from_preset(preset),
             buffer: String::new(),
+            armed: false,
             reason: reason.to_string(),
             replacement: None,
         }
@@ -208,6 +266,7 @@ impl PatternRule {
         Self {
             config: PatternConfig::from_preset(PatternPreset::Email),
             buffer: String::new(),
+            armed: false,
             reason: "email redacted".to_string(),
             replacement: Some(replacement.to_string()),
         }
@@ -218,6 +277,7 @@ impl PatternRule {
         Self {
             config: PatternConfig::from_preset(PatternPreset::Url),
             buffer: String::new(),
+            armed: false,
             reason: "url redacted".to_string(),
             replacement: Some(replacement.to_string()),
         }
@@ -228,6 +288,7 @@ impl PatternRule {
         Self {
             config: PatternConfig::from_preset(PatternPreset::Ipv4),
             buffer: String::new(),
+            armed: false,
             reason: "ip redacted".to_string(),
             replacement: Some(replacement.to_string()),
         }
@@ -238,6 +299,7 @@ impl PatternRule {
         Self {
             config: PatternConfig::from_preset(PatternPreset::CreditCard),
             buffer: String::new(),
+            armed: false,
             reason: "card redacted".to_string(),
             replacement: Some(replacement.to_string()),
         }
@@ -248,6 +310,7 @@ impl PatternRule {
         Self {
             config: PatternConfig::custom(pattern, description),
             buffer: String::new(),
+            armed: false,
             reason: reason.to_string(),
             replacement: None,
         }
@@ -258,6 +321,7 @@ impl PatternRule {
         Self {
             config,
             buffer: String::new(),
+            armed: false,
             reason: reason.to_string(),
             replacement: None,
         }
@@ -271,27 +335,27 @@ impl PatternRule {
     /// - Easy security auditing
     /// - Deterministic behavior across all platforms
     fn matches_pattern(&self, text: &str) -> bool {
-        let search_text = if self.config.case_insensitive {
-            text.to_lowercase()
+        // Only copy the text when it actually needs case folding
+        let search_text: Cow<'_, str> = if self.config.case_insensitive {
+            Cow::Owned(text.to_lowercase())
         } else {
-            text.to_string()
+            Cow::Borrowed(text)
         };
 
-        // Dispatch to appropriate specialized matcher based on description
-        // Using description matching for now; could use enum in future refactor
-        match self.config.description.as_str() {
-            desc if desc.contains("email") => self.check_email_pattern(&search_text),
-            desc if desc.contains("URL") => self.check_url_pattern(&search_text),
-            desc if desc.contains("IPv4") => self.check_ipv4_pattern(&search_text),
-            desc if desc.contains("credit card") => self.check_credit_card_pattern(&search_text),
-            _ => {
+        // Dispatch to the specialized matcher resolved at construction time
+        match self.config.kind {
+            MatcherKind::Email => self.check_email_pattern(&search_text),
+            MatcherKind::Url => self.check_url_pattern(&search_text),
+            MatcherKind::Ipv4 => self.check_ipv4_pattern(&search_text),
+            MatcherKind::CreditCard => self.check_credit_card_pattern(&search_text),
+            MatcherKind::Literal => {
                 // Fallback for custom patterns: simple substring search
-                let pattern_text = if self.config.case_insensitive {
-                    self.config.pattern.to_lowercase()
+                let pattern_text: Cow<'_, str> = if self.config.case_insensitive {
+                    Cow::Owned(self.config.pattern.to_lowercase())
                 } else {
-                    self.config.pattern.clone()
+                    Cow::Borrowed(&self.config.pattern)
                 };
-                search_text.contains(&pattern_text)
+                search_text.contains(pattern_text.as_ref())
             }
         }
     }
@@ -428,12 +492,12 @@ impl PatternRule {
     ///
     /// Uses specialized rewriters for each preset pattern type
     fn rewrite_text(&self, text: &str, replacement: &str) -> String {
-        match self.config.description.as_str() {
-            desc if desc.contains("email") => self.rewrite_emails(text, replacement),
-            desc if desc.contains("URL") => self.rewrite_urls(text, replacement),
-            desc if desc.contains("IPv4") => self.rewrite_ipv4(text, replacement),
-            desc if desc.contains("credit card") => self.rewrite_credit_cards(text, replacement),
-            _ => text.to_string(), // No rewrite for unknown patterns
+        match self.config.kind {
+            MatcherKind::Email => self.rewrite_emails(text, replacement),
+            MatcherKind::Url => self.rewrite_urls(text, replacement),
+            MatcherKind::Ipv4 => self.rewrite_ipv4(text, replacement),
+            MatcherKind::CreditCard => self.rewrite_credit_cards(text, replacement),
+            MatcherKind::Literal => text.to_string(), // No rewrite for unknown patterns
         }
     }
 
@@ -562,8 +626,14 @@ impl Rule for PatternRule {
         // Append chunk to buffer
         self.buffer.push_str(chunk);
 
+        // Only the new chunk needs scanning for the trigger byte; until one
+        // has been seen, the buffer cannot match and the full check is skipped
+        if !self.armed {
+            self.armed = self.config.kind.may_match(chunk);
+        }
+
         // Check if buffer matches pattern
-        if self.matches_pattern(&self.buffer) {
+        if self.armed && self.matches_pattern(&self.buffer) {
             // Save the decision
             let decision = if let Some(ref replacement) = self.replacement {
                 let rewritten = self.rewrite_text(&self.buffer, replacement);
@@ -578,6 +648,7 @@ impl Rule for PatternRule {
             
             // Clear buffer after match - pattern has been detected and handled
             self.buffer.clear();
+            self.armed = false;
             decision
         } else {
             // Keep buffer size reasonable
@@ -586,6 +657,8 @@ impl Rule for PatternRule {
             if self.buffer.len() > MAX_BUFFER {
                 let keep = self.buffer.len() - MAX_BUFFER;
                 self.buffer = self.buffer[keep..].to_string();
+                // The trigger byte may have been trimmed away
+                self.armed = self.config.kind.may_match(&self.buffer);
             }
             Decision::Allow
         }
@@ -593,11 +666,18 @@ impl Rule for PatternRule {
 
     fn reset(&mut self) {
         self.buffer.clear();
+        self.armed = false;
     }
 
     fn name(&self) -> &str {
         "pattern_rule"
     }
+
+    fn fork(&self) -> Option<Box<dyn Rule>> {
+        let mut rule = self.clone();
+        rule.reset();
+        Some(Box::new(rule))
+    }
 }
 
 #[cfg(test)]
@@ -688,6 +768,47 @@ mod tests {
         assert!(rule.feed("This contains SECRET data").is_block());
     }
 
+    #[test]
+    fn test_matcher_resolved_from_description() {
+        assert_eq!(
+            PatternConfig::from_preset(PatternPreset::EmailStrict).kind,
+            MatcherKind::Email
+        );
+        assert_eq!(
+            PatternConfig::from_preset(PatternPreset::CreditCard).kind,
+            MatcherKind::CreditCard
+        );
+        assert_eq!(PatternConfig::custom("SECRET", "secret keyword").kind, MatcherKind::Literal);
+    }
+
+    #[test]
+    fn test_custom_case_insensitive_pattern() {
+        let config = PatternConfig::custom("secret", "secret keyword").case_insensitive(true);
+        let mut rule = PatternRule::with_config(config, "found secret");
+
+        assert!(rule.feed("This contains SECRET data").is_block());
+    }
+
+    #[test]
+    fn test_prefilter_requires_trigger_byte() {
+        assert!(!MatcherKind::Email.may_match("user at example dot com"));
+        assert!(MatcherKind::Email.may_match("user@"));
+        assert!(MatcherKind::Url.may_match("https:"));
+        assert!(!MatcherKind::Ipv4.may_match("192 168 1 1"));
+        assert!(MatcherKind::CreditCard.may_match("card 4"));
+        assert!(MatcherKind::Literal.may_match(""));
+    }
+
+    #[test]
+    fn test_trigger_in_earlier_chunk_still_matches() {
+        let mut rule = PatternRule::email("found email");
+
+        // The '@' arrives first; later chunks without it must still complete the match
+        assert!(rule.feed("john@").is_allow());
+        assert!(rule.feed("example").is_allow());
+        assert!(rule.feed(".com").is_block());
+    }
+
     #[test]
     fn test_reset_clears_buffer() {
         let mut rule = PatternRule::email("found email");
@@ -26,12 +26,19 @@
 //!
 //! The implementation uses `MatchKind::LeftmostFirst` to ensure deterministic behavior
 //! when multiple patterns overlap. This guarantees predictable results across all platforms.
+//!
+//! Automata are always built as full DFAs (no failure-link walking at match time).
+//! Small sets of short tokens (up to 64 tokens, at least 2 bytes each) are scanned with
+//! aho-corasick's packed searcher instead of the automaton. The searcher is selected
+//! once at construction time and uses the same leftmost-first semantics.
 
+use alloc::boxed::Box;
 use alloc::format;
 use alloc::string::{String, ToString};
+use alloc::sync::Arc;
 use alloc::vec::Vec;
 
-use aho_corasick::{AhoCorasick, AhoCorasickBuilder, MatchKind};
+use aho_corasick::{packed, AhoCorasick, AhoCorasickBuilder, AhoCorasickKind, Match, MatchKind};
 
 use crate::core::{Decision, Rule};
 
@@ -84,6 +91,128 @@ impl SequenceConfig {
     }
 }
 
+/// Maximum number of tokens handled by the packed searcher
+const PACKED_MAX_TOKENS: usize = 64;
+
+/// Minimum token length (in bytes) handled by the packed searcher
+const PACKED_MIN_TOKEN_LEN: usize = 2;
+
+/// Maximum number of distinct token lists kept in the compiled matcher cache
+#[cfg(feature = "std")]
+const MATCHER_CACHE_CAPACITY: usize = 256;
+
+/// Build a leftmost-first Aho-Corasick automaton, preferring a full DFA
+///
+/// A DFA precomputes every failure transition, so each input byte costs a
+/// single table lookup instead of a variable-length walk up the failure
+/// chain. Its transition table is indexed by byte class (premultiplied
+/// state IDs), which keeps it compact for the small token sets used here.
+/// If the DFA cannot be built (state ID overflow on huge pattern sets),
+/// the builder's automatic choice is used instead.
+fn build_dfa<P: AsRef<[u8]>>(patterns: &[P]) -> AhoCorasick {
+    let mut builder = AhoCorasickBuilder::new();
+    builder.match_kind(MatchKind::LeftmostFirst);
+
+    if let Ok(ac) = builder.kind(Some(AhoCorasickKind::DFA)).build(patterns) {
+        return ac;
+    }
+
+    // This cannot fail since callers validate patterns are non-empty
+    builder
+        .kind(None)
+        .build(patterns)
+        .expect("Failed to build Aho-Corasick automaton (this should never happen)")
+}
+
+/// Length of the longest token (100 if there are no tokens)
+fn max_token_len(tokens: &[String]) -> usize {
+    tokens.iter().map(|t| t.len()).max().unwrap_or(100)
+}
+
+/// Literal matcher used to locate sequence tokens in the buffer
+///
+/// Small sets of short literals (the common case: "how", "to", "build", ...)
+/// are scanned with the packed searcher from aho-corasick. On haystacks of at
+/// least `Searcher::minimum_len()` bytes (17 for a set like the one above) it
+/// runs Teddy, which checks 16 or 32 bytes at a time using SIMD nibble lookups
+/// and verifies candidates afterwards. Shorter haystacks are scanned with
+/// Rabin-Karp instead, and that is the usual case here: the trimmed streaming
+/// buffer holds at most about two of the longest token plus the new chunk.
+/// Larger or single-byte token sets, and targets where Teddy is unavailable,
+/// fall back to the Aho-Corasick automaton.
+///
+/// Both variants use leftmost-first semantics, so the selected matcher
+/// never changes which token is found.
+#[derive(Clone)]
+enum TokenMatcher {
+    /// Packed searcher (Teddy, or Rabin-Karp on short haystacks)
+    Packed(packed::Searcher),
+    /// Aho-Corasick automaton
+    Automaton(AhoCorasick),
+}
+
+impl TokenMatcher {
+    /// Select and build the matcher for the given tokens
+    fn new(tokens: &[String]) -> Self {
+        let min_len = tokens.iter().map(|t| t.len()).min().unwrap_or(0);
+        if tokens.len() <= PACKED_MAX_TOKENS && min_len >= PACKED_MIN_TOKEN_LEN {
+            let searcher = packed::Config::new()
+                .match_kind(packed::MatchKind::LeftmostFirst)
+                .builder()
+                .extend(tokens)
+                .build();
+            if let Some(searcher) = searcher {
+                return TokenMatcher::Packed(searcher);
+            }
+        }
+
+        TokenMatcher::Automaton(build_dfa(tokens))
+    }
+
+    /// Return a shared matcher for `tokens`, compiling it at most once per process
+    ///
+    /// Applications typically build the same rule sets over and over (e.g. a
+    /// middleware constructing its rules per request). Matchers depend only
+    /// on the token list, so compiled ones are interned in a global cache and
+    /// handed out as `Arc`s. The cache is bounded: when it is full it is
+    /// cleared, and existing rules keep their matchers alive.
+    #[cfg(feature = "std")]
+    fn cached(tokens: &[String]) -> Arc<Self> {
+        use alloc::collections::BTreeMap;
+        use std::sync::Mutex;
+
+        static CACHE: Mutex<BTreeMap<Vec<String>, Arc<TokenMatcher>>> = Mutex::new(BTreeMap::new());
+
+        // A panic while holding the lock cannot leave the map inconsistent
+        let mut cache = CACHE.lock().unwrap_or_else(|e| e.into_inner());
+        if let Some(matcher) = cache.get(tokens) {
+            return Arc::clone(matcher);
+        }
+
+        if cache.len() >= MATCHER_CACHE_CAPACITY {
+            cache.clear();
+        }
+        let matcher = Arc::new(TokenMatcher::new(tokens));
+        cache.insert(tokens.to_vec(), Arc::clone(&matcher));
+        matcher
+    }
+
+    /// Without `std` there is no global lock, so every rule compiles its own matcher
+    #[cfg(not(feature = "std"))]
+    fn cached(tokens: &[String]) -> Arc<Self> {
+        Arc::new(TokenMatcher::new(tokens))
+    }
+
+    /// Find the leftmost match of `target` among all token matches in `haystack`
+    fn find_token(&self, haystack: &str, tokens: &[String], target: &str) -> Option<Match> {
+        let is_target = |mat: &Match| tokens[mat.pattern().as_usize()] == target;
+        match self {
+            TokenMatcher::Packed(searcher) => searcher.find_iter(haystack).find(is_target),
+            TokenMatcher::Automaton(ac) => ac.find_iter(haystack).find(is_target),
+        }
+    }
+}
+
 /// A rule that blocks when a forbidden sequence of tokens is detected
 ///
 /// This implementation uses the aho-corasick library for efficient DFA-based
@@ -126,12 +255,13 @@ impl SequenceConfig {
 ///     config
 /// );
 /// ```
+#[derive(Clone)]
 pub struct ForbiddenSequenceRule {
     /// The sequence of tokens to detect
     tokens: Vec<String>,
-    /// Aho-Corasick automaton for efficient token matching
-    ac: AhoCorasick,
-    /// Aho-Corasick automaton for stop words (if any)
+    /// Literal matcher for the sequence tokens (shared between identical rules)
+    matcher: Arc<TokenMatcher>,
+    /// Aho-Corasick DFA for stop words (if any)
     stop_words_ac: Option<AhoCorasick>,
     /// Current position in the sequence (0-based)
     state: usize,
@@ -147,6 +277,8 @@ pub struct ForbiddenSequenceRule {
     replacement: Option<String>,
     /// Last score from the most recent decision
     last_decision_score: u32,
+    /// Length of the longest token, used to bound the buffer
+    max_token_len: usize,
 }
 
 impl ForbiddenSequenceRule {
@@ -167,29 +299,21 @@ impl ForbiddenSequenceRule {
         // Validate that we have at least one token
         assert!(!tokens_owned.is_empty(), "ForbiddenSequenceRule requires at least one token");
         
-        // Build Aho-Corasick automaton for the tokens
-        // Use MatchKind::LeftmostFirst for deterministic matching
-        // This cannot fail since we validated tokens are non-empty
-        let ac = AhoCorasickBuilder::new()
-            .match_kind(MatchKind::LeftmostFirst)
-            .build(&tokens_owned)
-            .expect("Failed to build Aho-Corasick automaton (this should never happen)");
+        // Build or reuse the token matcher (packed searcher or Aho-Corasick
+        // automaton). Both use leftmost-first semantics for deterministic matching
+        let matcher = TokenMatcher::cached(&tokens_owned);
+        let max_token_len = max_token_len(&tokens_owned);
         
         // Build Aho-Corasick automaton for stop words if any
         let stop_words_ac = if !config.stop_words.is_empty() {
-            Some(
-                AhoCorasickBuilder::new()
-                    .match_kind(MatchKind::LeftmostFirst)
-                    .build(&config.stop_words)
-                    .expect("Failed to build stop words automaton (this should never happen)")
-            )
+            Some(build_dfa(&config.stop_words))
         } else {
             None
         };
         
         Self {
             tokens: tokens_owned,
-            ac,
+            matcher,
             stop_words_ac,
             state: 0,
             buffer: String::new(),
@@ -198,6 +322,7 @@ impl ForbiddenSequenceRule {
             score: 0,
             replacement: None,
             last_decision_score: 0,
+            max_token_len,
         }
     }
 
@@ -220,14 +345,12 @@ impl ForbiddenSequenceRule {
         let tokens_owned: Vec<String> = tokens.iter().map(|s| s.as_ref().to_string()).collect();
         assert!(!tokens_owned.is_empty(), "ForbiddenSequenceRule requires at least one token");
         
-        let ac = AhoCorasickBuilder::new()
-            .match_kind(MatchKind::LeftmostFirst)
-            .build(&tokens_owned)
-            .expect("Failed to build Aho-Corasick automaton (this should never happen)");
+        let matcher = TokenMatcher::cached(&tokens_owned);
+        let max_token_len = max_token_len(&tokens_owned);
         
         Self {
             tokens: tokens_owned,
-            ac,
+            matcher,
             stop_words_ac: None,
             state: 0,
             buffer: String::new(),
@@ -236,6 +359,7 @@ impl ForbiddenSequenceRule {
             score,
             replacement: None,
             last_decision_score: 0,
+            max_token_len,
         }
     }
 
@@ -248,14 +372,12 @@ impl ForbiddenSequenceRule {
         let tokens_owned: Vec<String> = tokens.iter().map(|s| s.as_ref().to_string()).collect();
         assert!(!tokens_owned.is_empty(), "ForbiddenSequenceRule requires at least one token");
         
-        let ac = AhoCorasickBuilder::new()
-            .match_kind(MatchKind::LeftmostFirst)
-            .build(&tokens_owned)
-            .expect("Failed to build Aho-Corasick automaton (this should never happen)");
+        let matcher = TokenMatcher::cached(&tokens_owned);
+        let max_token_len = max_token_len(&tokens_owned);
         
         Self {
             tokens: tokens_owned,
-            ac,
+            matcher,
             stop_words_ac: None,
             state: 0,
             buffer: String::new(),
@@ -264,6 +386,7 @@ impl ForbiddenSequenceRule {
             score: 0,
             replacement: Some(replacement.to_string()),
             last_decision_score: 0,
+            max_token_len,
         }
     }
 
@@ -324,23 +447,9 @@ impl ForbiddenSequenceRule {
 
             let target = &self.tokens[self.state];
 
-            // Use aho-corasick to check if the target token exists in the buffer
+            // Find the leftmost occurrence of our target token in the buffer
             // Since we may have duplicate tokens, we can't rely on pattern IDs alone
-            // We need to find the leftmost occurrence of our target token
-            let mut leftmost_match: Option<aho_corasick::Match> = None;
-            for mat in self.ac.find_iter(&self.buffer) {
-                let matched_token = &self.tokens[mat.pattern().as_usize()];
-                // Check if this match is for our current target token
-                if matched_token == target {
-                    // Keep track of the leftmost match
-                    if leftmost_match.is_none() || mat.start() < leftmost_match.unwrap().start() {
-                        leftmost_match = Some(mat);
-                    }
-                    break; // LeftmostFirst should give us the first occurrence already
-                }
-            }
-            
-            if let Some(mat) = leftmost_match {
+            if let Some(mat) = self.matcher.find_token(&self.buffer, &self.tokens, target) {
                 // Found the token - advance state
                 self.state += 1;
 
@@ -360,7 +469,7 @@ impl ForbiddenSequenceRule {
 
         // Prevent buffer from growing unbounded
         // Keep only the last N characters where N is the longest token length
-        let max_len = self.tokens.iter().map(|t| t.len()).max().unwrap_or(100);
+        let max_len = self.max_token_len;
         if self.buffer.len() > max_len * 2 {
             let keep = self.buffer.len() - max_len;
             self.buffer = self.buffer[keep..].to_string();
@@ -377,9 +486,13 @@ impl Rule for ForbiddenSequenceRule {
         }
 
         // Save original buffer content before check_match modifies it
-        let original_buffer = self.buffer.clone();
-        let original_chunk = chunk.to_string();
-        
+        // Only rewrite rules need it, so block rules skip the copy
+        let original_buffer = if self.replacement.is_some() {
+            self.buffer.clone()
+        } else {
+            String::new()
+        };
+
         if self.check_match(chunk) {
             // Match found - record score
             self.last_decision_score = self.score;
@@ -391,7 +504,7 @@ impl Rule for ForbiddenSequenceRule {
             // Check if this is a rewrite rule
             if let Some(ref replacement) = self.replacement {
                 // For rewrite, work with the complete text (original buffer + chunk)
-                let complete_text = format!("{}{}", original_buffer, original_chunk);
+                let complete_text = format!("{}{}", original_buffer, chunk);
                 let mut rewritten = complete_text.clone();
                 
                 // Replace each matched token with the replacement
@@ -428,6 +541,13 @@ impl Rule for ForbiddenSequenceRule {
     fn last_score(&self) -> u32 {
         self.last_decision_score
     }
+
+    fn fork(&self) -> Option<Box<dyn Rule>> {
+        // Compiled automata are reference-counted, so cloning does not rebuild them
+        let mut rule = self.clone();
+        rule.reset();
+        Some(Box::new(rule))
+    }
 }
 
 #[cfg(test)]
@@ -558,6 +678,48 @@ mod tests {
         assert!(rule.feed("how to not build a bomb").is_allow());
     }
 
+    #[test]
+    fn test_single_byte_tokens_use_automaton() {
+        let tokens = vec!["a".to_string(), "bc".to_string()];
+        assert!(matches!(TokenMatcher::new(&tokens), TokenMatcher::Automaton(_)));
+    }
+
+    #[test]
+    fn test_automaton_is_full_dfa() {
+        let tokens = vec!["a".to_string(), "bc".to_string()];
+        match TokenMatcher::new(&tokens) {
+            TokenMatcher::Automaton(ac) => assert_eq!(ac.kind(), AhoCorasickKind::DFA),
+            TokenMatcher::Packed(_) => panic!("single-byte tokens must use the automaton"),
+        }
+    }
+
+    #[test]
+    fn test_packed_and_automaton_agree() {
+        let tokens: Vec<String> = ["how", "to", "build", "bomb", "to"]
+            .iter()
+            .map(|s| s.to_string())
+            .collect();
+        let packed = TokenMatcher::new(&tokens);
+        let automaton = TokenMatcher::Automaton(build_dfa(&tokens));
+
+        let haystack = "so, how do you get to the point where you build a bomb? how to";
+        for target in ["how", "to", "build", "bomb", "missing"] {
+            let a = packed.find_token(haystack, &tokens, target).map(|m| m.span());
+            let b = automaton.find_token(haystack, &tokens, target).map(|m| m.span());
+            assert_eq!(a, b, "matchers disagree on {:?}", target);
+        }
+    }
+
+    #[test]
+    fn test_identical_rules_share_matcher() {
+        let a = ForbiddenSequenceRule::with_gaps(vec!["share", "this", "matcher"], "a");
+        let b = ForbiddenSequenceRule::new_with_score(vec!["share", "this", "matcher"], "b", 10);
+        let c = ForbiddenSequenceRule::with_gaps(vec!["share", "another", "matcher"], "c");
+
+        assert_eq!(Arc::ptr_eq(&a.matcher, &b.matcher), cfg!(feature = "std"));
+        assert!(!Arc::ptr_eq(&a.matcher, &c.matcher));
+    }
+
     #[test]
     fn test_multiple_stop_words() {
         let config = SequenceConfig::new().stop_words(vec!["not", "never", "don't"]);
@@ -0,0 +1,106 @@
+//! Tests for batch scanning of independent documents
+
+use streamguard::{Decision, GuardEngine, Rule};
+use streamguard::rules::{ForbiddenSequenceRule, PatternRule};
+
+fn build_engine() -> GuardEngine {
+    let mut engine = GuardEngine::new();
+    engine.add_rule(Box::new(PatternRule::email_rewrite("[EMAIL]")));
+    engine.add_rule(Box::new(PatternRule::credit_card("credit card detected")));
+    engine.add_rule(Box::new(ForbiddenSequenceRule::with_gaps(
+        vec!["how", "to", "hack"],
+        "security violation",
+    )));
+    engine
+}
+
+fn sample_docs(count: usize) -> Vec<String> {
+    let templates = [
+        "Invoice sent to customer@company.com",
+        "Payment with card 4532-1234-5678-9010",
+        "Meeting notes from yesterday",
+        "how to hack the mainframe",
+        "Totally harmless text",
+    ];
+    (0..count)
+        .map(|i| templates[i % templates.len()].to_string())
+        .collect()
+}
+
+#[test]
+fn test_scan_batch_matches_reset_and_feed() {
+    let docs = sample_docs(10);
+
+    let mut reference = build_engine();
+    let expected: Vec<Decision> = docs
+        .iter()
+        .map(|doc| {
+            reference.reset();
+            reference.feed(doc)
+        })
+        .collect();
+
+    let mut engine = build_engine();
+    assert_eq!(engine.scan_batch(&docs, false), expected);
+}
+
+#[test]
+fn test_scan_batch_documents_are_independent() {
+    let mut engine = build_engine();
+
+    // A blocked document must not leak its stopped state into the next one
+    let decisions = engine.scan_batch(&["how to hack", "safe text"], false);
+    assert!(decisions[0].is_block());
+    assert!(decisions[1].is_allow());
+    assert!(!engine.is_stopped());
+}
+
+#[test]
+fn test_scan_batch_parallel_preserves_order() {
+    let docs = sample_docs(500);
+
+    let mut serial = build_engine();
+    let expected = serial.scan_batch(&docs, false);
+
+    let mut parallel = build_engine();
+    let decisions = parallel.scan_batch(&docs, true);
+
+    assert_eq!(decisions.len(), docs.len());
+    assert_eq!(decisions, expected);
+}
+
+#[test]
+fn test_scan_batch_parallel_falls_back_for_unforkable_rules() {
+    struct ContainsRule;
+
+    impl Rule for ContainsRule {
+        fn feed(&mut self, chunk: &str) -> Decision {
+            if chunk.contains("hack") {
+                Decision::Block {
+                    reason: "hack".to_string(),
+                }
+            } else {
+                Decision::Allow
+            }
+        }
+
+        fn reset(&mut self) {}
+    }
+
+    let mut engine = GuardEngine::new();
+    engine.add_rule(Box::new(ContainsRule));
+    assert!(engine.fork().is_none());
+
+    let docs = sample_docs(200);
+    let decisions = engine.scan_batch(&docs, true);
+    assert_eq!(decisions.len(), docs.len());
+    assert!(decisions[3].is_block());
+    assert!(decisions[4].is_allow());
+}
+
+#[test]
+fn test_empty_batch() {
+    let mut engine = build_engine();
+    let docs: Vec<String> = Vec::new();
+    assert!(engine.scan_batch(&docs, true).is_empty());
+}
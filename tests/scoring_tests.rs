@@ -175,3 +175,25 @@ fn test_weighted_scoring() {
     let _decision = engine.feed("warning: delete or kill the process");
     assert_eq!(engine.current_score(), 160);
 }
+
+#[test]
+fn test_score_saturates_instead_of_overflowing() {
+    let mut engine = GuardEngine::with_score_threshold(u32::MAX);
+    
+    engine.add_rule(Box::new(ForbiddenSequenceRule::new_with_score(
+        vec!["alpha".to_string()],
+        "alpha",
+        u32::MAX - 10,
+    )));
+    
+    engine.add_rule(Box::new(ForbiddenSequenceRule::new_with_score(
+        vec!["beta".to_string()],
+        "beta",
+        u32::MAX - 10,
+    )));
+    
+    // Both rules fire in the same chunk; the sum saturates at u32::MAX
+    let decision = engine.feed("alpha and beta");
+    assert_eq!(engine.current_score(), u32::MAX);
+    assert!(decision.is_block());
+}